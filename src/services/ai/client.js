@@ -12,6 +12,9 @@ class AIClient {
   constructor() {
     this.enabled = config.ai.enabled;
     this.pythonPath = 'python3'; // or 'python' depending on system
+    this.worker = null;
+    this.pending = []; // FIFO of { resolve, reject } awaiting a response line
+    this.stdoutBuffer = '';
   }
 
   /**
@@ -65,50 +68,98 @@ class AIClient {
   }
 
   /**
-   * Call Python ML model
+   * Get or spawn the long-lived Python worker process
+   * The worker loads the ML model once and then answers newline-delimited
+   * JSON requests, so we avoid paying the model load on every forecast.
    */
-  async callPythonModel(marketData) {
-    return new Promise((resolve, reject) => {
-      // Get the directory of the current file
-      const currentDir = new URL('.', import.meta.url).pathname;
-      const scriptPath = `${currentDir}forecast.py`;
-      const python = spawn(this.pythonPath, [scriptPath]);
-
-      let stdout = '';
-      let stderr = '';
-
-      python.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      python.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          logger.error(`Python script error: ${stderr}`);
-          reject(new Error(`Python script exited with code ${code}`));
-          return;
+  ensureWorker() {
+    if (this.worker) {
+      return this.worker;
+    }
+
+    // Get the directory of the current file
+    const currentDir = new URL('.', import.meta.url).pathname;
+    const scriptPath = `${currentDir}forecast.py`;
+    const python = spawn(this.pythonPath, [scriptPath]);
+
+    python.stdout.on('data', (data) => {
+      this.stdoutBuffer += data.toString();
+
+      // Responses arrive in request order, one JSON object per line
+      let newlineIndex;
+      while ((newlineIndex = this.stdoutBuffer.indexOf('\n')) !== -1) {
+        const line = this.stdoutBuffer.slice(0, newlineIndex);
+        this.stdoutBuffer = this.stdoutBuffer.slice(newlineIndex + 1);
+
+        const request = this.pending.shift();
+        if (!request) {
+          continue;
         }
 
         try {
-          const forecast = JSON.parse(stdout);
-          resolve(forecast);
+          request.resolve(JSON.parse(line));
         } catch (error) {
           logger.error('Error parsing Python output:', error);
-          reject(error);
+          request.reject(error);
         }
-      });
+      }
+    });
+
+    python.stderr.on('data', (data) => {
+      logger.debug(`Python forecast service: ${data.toString().trim()}`);
+    });
+
+    python.on('error', (error) => {
+      logger.error('Error spawning Python process:', error);
+      this.worker = null;
+      this.failPending(error);
+    });
+
+    // A write can race the worker dying before 'close' fires; without this
+    // listener the resulting EPIPE would crash the whole process
+    python.stdin.on('error', (error) => {
+      logger.error('Error writing to Python process:', error);
+      this.worker = null;
+      this.failPending(error);
+    });
 
-      python.on('error', (error) => {
-        logger.error('Error spawning Python process:', error);
-        reject(error);
-      });
+    python.on('close', (code) => {
+      if (code !== 0 && code !== null) {
+        logger.error(`Python script exited with code ${code}`);
+      }
+      this.worker = null;
+      this.stdoutBuffer = '';
+      this.failPending(new Error(`Python script exited with code ${code}`));
+    });
+
+    this.worker = python;
+    return python;
+  }
+
+  /**
+   * Reject all in-flight requests (worker died or failed to spawn)
+   */
+  failPending(error) {
+    const pending = this.pending;
+    this.pending = [];
+    pending.forEach((request) => request.reject(error));
+  }
+
+  /**
+   * Call Python ML model
+   */
+  async callPythonModel(marketData) {
+    return new Promise((resolve, reject) => {
+      const python = this.ensureWorker();
+      if (!python.stdin.writable) {
+        this.worker = null;
+        reject(new Error('Python worker is not writable'));
+        return;
+      }
+      this.pending.push({ resolve, reject });
 
-      // Send market data to Python script
-      python.stdin.write(JSON.stringify(marketData));
-      python.stdin.end();
+      // Send market data to the worker as a single NDJSON line
+      python.stdin.write(`${JSON.stringify(marketData)}\n`);
     });
   }
 
@@ -7,185 +7,505 @@ Generates probabilistic forecasts for prediction markets using machine learning
 import json
 import sys
 import numpy as np
-import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
-import pickle
+from scipy.special import xlogy
+import joblib
+import math
 import os
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+# Fast ISO-8601 parsing: ciso8601's C parser when available, otherwise
+# datetime.fromisoformat (which accepts the Z suffix on Python 3.11+)
+try:
+    import ciso8601
+    _parse_datetime = ciso8601.parse_datetime
+except ImportError:
+    def _parse_datetime(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Prefer orjson (Rust implementation, several times faster on large
+# history payloads) for the stdin/stdout hot path, falling back to stdlib json
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Optional compiled tree inference: with treelite installed the loaded forest
+# is compiled once to native code, replacing the per-tree traversal overhead
+# of sklearn's predict_proba with straight-line compiled C
+try:
+    import treelite
+    import treelite_runtime
+except ImportError:
+    treelite = None
+    treelite_runtime = None
+
+# Timestamp formatting without building a datetime object per call: responses
+# within the same second reuse the cached second-level prefix and only the
+# microseconds are formatted fresh
+_iso_cache = (-1, '')
+
+def _fast_iso(t=None):
+    global _iso_cache
+    if t is None:
+        t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _iso_cache
+    if sec != cached_sec:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _iso_cache = (sec, prefix)
+    return f'{prefix}.{int((t - sec) * 1e6):06d}'
+
+# Preformatted response template for the dominant 2-outcome market shape;
+# filling it in skips the generic JSON encoder for most responses
+_TEMPLATE_2 = (
+    '{{"forecast":[{{"outcome":{n0},"outcomeId":0,"probability":{p0},"confidence":{c}}},'
+    '{{"outcome":{n1},"outcomeId":1,"probability":{p1},"confidence":{c}}}],'
+    '"confidence":{c},"modelVersion":"1.0.0","timestamp":"{ts}"}}'
+)
+
+def _dumps_response(response):
+    """
+    Serialize a forecast response, using the preformatted template when the
+    response has the standard binary shape and the JSON encoder otherwise
+    """
+    if isinstance(response, dict) and len(response) == 4:
+        forecast = response.get('forecast')
+        if forecast is not None and len(forecast) == 2:
+            first, second = forecast
+            try:
+                return _TEMPLATE_2.format(
+                    n0=json.dumps(first['outcome']),
+                    p0=repr(first['probability']),
+                    n1=json.dumps(second['outcome']),
+                    p1=repr(second['probability']),
+                    c=repr(response['confidence']),
+                    ts=response['timestamp'],
+                )
+            except (KeyError, TypeError):
+                pass
+    return _json_dumps(response)
+
+# Shape check for resolution timestamps so malformed upstream data skips the
+# parse entirely instead of raising on the hot path
+_ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2})?)?')
+
+# Width of the feature vector produced by extract_features
+NUM_FEATURES = 12
+
+# Max number of market snapshots whose forecasts are memoized per model
+FORECAST_CACHE_SIZE = 4096
+
+def _price_stats(p):
+    """Mean, standard deviation and range of a price vector in one fused pass"""
+    n = p.shape[0]
+    s = 0.0
+    ss = 0.0
+    mn = p[0]
+    mx = p[0]
+    for i in range(n):
+        v = p[i]
+        s += v
+        ss += v * v
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+    mean = s / n
+    return mean, math.sqrt(max(0.0, ss / n - mean * mean)), mx - mn
+
+# JIT-compile the stats kernel when numba is installed; for the handful of
+# outcomes a market carries, the plain-Python loop already beats chaining
+# four separate NumPy reductions
+try:
+    from numba import njit
+    _price_stats = njit(cache=True, fastmath=True)(_price_stats)
+except ImportError:
+    pass
+
+class LinearForecastModel:
+    """
+    Multinomial logistic model stored as raw coef/intercept arrays
+    predict_proba is a single matrix-vector product plus a softmax, roughly
+    two orders of magnitude cheaper than walking a 100-tree forest, and the
+    exported .npz weighs KBs instead of MBs
+    """
+    def __init__(self, coef, intercept):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = np.ascontiguousarray(intercept, dtype=np.float64)
+
+    def predict_proba(self, X):
+        logits = X @ self.coef.T + self.intercept
+        if self.coef.shape[0] == 1:
+            # Binary models store the positive-class logit only
+            p = 1.0 / (1.0 + np.exp(-logits[:, 0]))
+            return np.column_stack([1.0 - p, p])
+        # Stable softmax, computed in place
+        logits -= logits.max(axis=1, keepdims=True)
+        np.exp(logits, out=logits)
+        logits /= logits.sum(axis=1, keepdims=True)
+        return logits
+
 class MarketForecastModel:
     def __init__(self, model_path=None):
         self.model = None
         self.scaler = StandardScaler()
+        self.predictor = None
+        self._scaler_mean = None
+        self._scaler_inv_scale = None
+        self._forecast_cache = OrderedDict()
         self.model_path = model_path or './models/forecast_model.pkl'
         self.load_model()
     
     def load_model(self):
-        """Load trained model from file"""
+        """Load trained model from file (.npz selects the linear model)"""
         if os.path.exists(self.model_path):
+            if self.model_path.endswith('.npz'):
+                self._load_linear_model()
+                return
             try:
-                with open(self.model_path, 'rb') as f:
-                    model_data = pickle.load(f)
-                    self.model = model_data.get('model')
-                    self.scaler = model_data.get('scaler', StandardScaler())
+                # Memory-map the NumPy arrays backing the forest so cold start
+                # only faults in the pages actually touched, and worker
+                # processes share them through the page cache
+                model_data = joblib.load(self.model_path, mmap_mode='r')
+                self.model = model_data.get('model')
+                # Only accept a scaler that was actually fitted at training time
+                scaler = model_data.get('scaler')
+                self.scaler = scaler if hasattr(scaler, 'mean_') else StandardScaler()
+                if hasattr(self.scaler, 'mean_'):
+                    # Cache the fitted parameters as plain arrays so scaling
+                    # skips sklearn's per-call validation in transform
+                    self._scaler_mean = np.asarray(self.scaler.mean_, dtype=np.float64)
+                    self._scaler_inv_scale = 1.0 / np.asarray(self.scaler.scale_, dtype=np.float64)
+                # Single-threaded predict: for the small rows this service
+                # handles, joblib's thread spawn costs more than the tree walks
+                if hasattr(self.model, 'n_jobs'):
+                    self.model.n_jobs = 1
+                self._load_compiled_predictor()
                 print(f"Model loaded from {self.model_path}", file=sys.stderr)
             except Exception as e:
                 print(f"Error loading model: {e}", file=sys.stderr)
-                self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+                self.model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1)
         else:
             print(f"Model file not found, using default model", file=sys.stderr)
-            self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+            self.model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1)
+
+    def _load_linear_model(self):
+        """
+        Load a logistic-regression model exported as a plain .npz of coef and
+        intercept arrays, with the fitted scaler parameters alongside
+        """
+        try:
+            data = np.load(self.model_path)
+            self.model = LinearForecastModel(data['coef'], data['intercept'])
+            if 'scaler_mean' in data:
+                self._scaler_mean = np.asarray(data['scaler_mean'], dtype=np.float64)
+                self._scaler_inv_scale = 1.0 / np.asarray(data['scaler_scale'], dtype=np.float64)
+            print(f"Linear model loaded from {self.model_path}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error loading model: {e}", file=sys.stderr)
+            self.model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=1)
     
-    def extract_features(self, market_data):
+    def extract_features(self, market_data, now=None,
+                         _float=float, _log1p=math.log1p, _asarray=np.asarray,
+                         _zeros=np.zeros, _stats=_price_stats, _time=time.time):
         """
         Extract features from market data for prediction
         Features: volume, liquidity, time_to_resolution, price_volatility, etc.
+        Batch callers can pass `now` (epoch seconds) once for the whole batch.
+        The trailing defaults pre-bind hot globals as locals, skipping the
+        per-call dict lookups CPython pays for dotted access.
         """
-        features = []
-        
+        get = market_data.get
+
+        # Write features straight into a preallocated buffer; scalar math goes
+        # through the math module to avoid per-element NumPy dispatch overhead
+        out = _zeros((1, NUM_FEATURES), dtype=np.float64)
+
         # Volume features
-        volume = float(market_data.get('totalVolume', 0))
-        features.append(volume)
-        features.append(np.log1p(volume))  # Log transform
-        
+        volume = _float(get('totalVolume', 0))
+        out[0, 0] = volume
+        out[0, 1] = _log1p(volume)  # Log transform
+
         # Liquidity features
-        liquidity = float(market_data.get('totalLiquidity', 0))
-        features.append(liquidity)
-        features.append(np.log1p(liquidity))
-        
-        # Time features
-        resolution_time = market_data.get('resolutionTime')
-        if resolution_time:
+        liquidity = _float(get('totalLiquidity', 0))
+        out[0, 2] = liquidity
+        out[0, 3] = _log1p(liquidity)
+
+        # Time features (left at 0 when missing or unparseable); plain epoch
+        # arithmetic avoids tz-aware datetime subtraction per call
+        resolution_time = get('resolutionTime')
+        if isinstance(resolution_time, str) and _ISO_RE.match(resolution_time):
             try:
-                resolution_dt = datetime.fromisoformat(resolution_time.replace('Z', '+00:00'))
-                now = datetime.now(resolution_dt.tzinfo)
-                time_to_resolution = (resolution_dt - now).total_seconds() / 3600  # hours
-                features.append(time_to_resolution)
-                features.append(max(0, time_to_resolution))  # Clamped
-            except:
-                features.append(0)
-                features.append(0)
-        else:
-            features.append(0)
-            features.append(0)
-        
+                resolution_ts = _parse_datetime(resolution_time).timestamp()
+            except (ValueError, OverflowError, OSError):
+                pass
+            else:
+                time_to_resolution = (resolution_ts - (now or _time())) / 3600  # hours
+                out[0, 4] = time_to_resolution
+                out[0, 5] = max(0, time_to_resolution)  # Clamped
+
         # Price features
-        prices = market_data.get('prices', [])
+        prices = get('prices', [])
         if prices and len(prices) > 0:
-            prices_array = np.array([float(p) for p in prices])
-            features.append(np.mean(prices_array))  # Mean price
-            features.append(np.std(prices_array))    # Price volatility
-            features.append(np.max(prices_array) - np.min(prices_array))  # Price range
-            features.append(len(prices))  # Number of outcomes
+            prices_array = _asarray(prices, dtype=np.float64)
+            # Mean price, price volatility, price range
+            out[0, 6], out[0, 7], out[0, 8] = _stats(prices_array)
+            out[0, 9] = len(prices)  # Number of outcomes
         else:
-            features.extend([0, 0, 0, 2])  # Default values
-        
-        # Historical data features (if available)
-        history = market_data.get('history', [])
+            out[0, 9] = 2  # Default outcome count
+
+        # Historical data features (if available, else left at 0)
+        history = get('history', [])
         if history and len(history) > 0:
             recent_prices = [h.get('prices', []) for h in history[-10:]]  # Last 10 snapshots
-            if recent_prices:
+            lengths = {len(p) for p in recent_prices}
+            if len(recent_prices) > 1 and len(lengths) == 1 and 0 not in lengths:
+                # Common case: rectangular history, so a single stacked diff
+                # replaces the per-snapshot-pair Python averaging loop
+                arr = np.asarray(recent_prices, dtype=np.float64)
+                changes = np.diff(arr, axis=0).mean(axis=1)
+                out[0, 10] = changes.mean()  # Average price change
+                out[0, 11] = changes.std()   # Price change volatility
+            else:
+                # Ragged or partially-empty snapshots: pairwise fallback
                 price_changes = []
                 for i in range(1, len(recent_prices)):
                     if len(recent_prices[i]) > 0 and len(recent_prices[i-1]) > 0:
-                        change = np.mean([float(recent_prices[i][j]) - float(recent_prices[i-1][j]) 
+                        change = np.mean([float(recent_prices[i][j]) - float(recent_prices[i-1][j])
                                         for j in range(min(len(recent_prices[i]), len(recent_prices[i-1])))])
                         price_changes.append(change)
-                
+
                 if price_changes:
-                    features.append(np.mean(price_changes))  # Average price change
-                    features.append(np.std(price_changes))   # Price change volatility
-                else:
-                    features.extend([0, 0])
-            else:
-                features.extend([0, 0])
-        else:
-            features.extend([0, 0])
-        
-        return np.array(features).reshape(1, -1)
+                    out[0, 10] = np.mean(price_changes)  # Average price change
+                    out[0, 11] = np.std(price_changes)   # Price change volatility
+
+        return out
     
+    def _load_compiled_predictor(self):
+        """
+        Compile the loaded forest with treelite (if installed) and cache the
+        shared library next to the model, keyed on the model file mtime
+        """
+        self.predictor = None
+        if treelite is None or self.model is None or not hasattr(self.model, 'estimators_'):
+            return
+        try:
+            lib_path = self.model_path + '.so'
+            if not os.path.exists(lib_path) or os.path.getmtime(lib_path) < os.path.getmtime(self.model_path):
+                tl_model = treelite.sklearn.import_model(self.model)
+                tl_model.export_lib(toolchain='gcc', libpath=lib_path, params={'parallel_comp': 8})
+            self.predictor = treelite_runtime.Predictor(lib_path)
+            print(f"Compiled predictor loaded from {lib_path}", file=sys.stderr)
+        except Exception as e:
+            print(f"Treelite unavailable, falling back to sklearn predict: {e}", file=sys.stderr)
+            self.predictor = None
+
+    def _predict_proba(self, features_scaled):
+        """Class probabilities via the compiled predictor when available"""
+        if self.predictor is not None:
+            proba = np.atleast_1d(self.predictor.predict(treelite_runtime.DMatrix(features_scaled)))
+            if proba.ndim == 1:
+                # Binary models emit P(class 1) only
+                proba = np.column_stack([1.0 - proba, proba])
+            return proba
+        return self.model.predict_proba(features_scaled)
+
+    def _predict_proba_batch(self, X_scaled):
+        """
+        Batch class probabilities. For a sklearn forest the trees are walked
+        tree-by-tree across the whole batch, so each tree's node arrays are
+        streamed from memory once per batch instead of once per row, and the
+        accumulation happens in one preallocated buffer
+        """
+        if self.predictor is not None or not hasattr(self.model, 'estimators_'):
+            return self._predict_proba(X_scaled)
+        estimators = self.model.estimators_
+        out = np.zeros((X_scaled.shape[0], self.model.n_classes_), dtype=np.float64)
+        for est in estimators:
+            out += est.predict_proba(X_scaled)
+        out /= len(estimators)
+        return out
+
+    def _get_num_outcomes(self, market_data):
+        """Number of outcomes for a market (prices take precedence)"""
+        prices = market_data.get('prices', [])
+        if len(prices) > 0:
+            return len(prices)
+        return market_data.get('outcomeCount', 2)
+
+    def _price_distribution(self, market_data, num_outcomes):
+        """
+        Fallback distribution from current prices
+        (LMSR prices are already probabilities)
+        """
+        prices = market_data.get('prices', [])
+        if prices and len(prices) > 0:
+            # One C-level cast and normalization instead of per-element
+            # float() calls; tolist() hands back native Python floats
+            probs = np.asarray(prices, dtype=np.float64)
+            total = probs.sum()
+            if total > 0:
+                return (probs / total).tolist()
+        return [1.0 / num_outcomes] * num_outcomes
+
+    def _proba_to_distribution(self, proba, num_outcomes,
+                               _zeros=np.zeros, _xlogy=xlogy,
+                               _log2=math.log2, _ln2=math.log(2)):
+        """
+        Map a raw predict_proba row onto the market's outcomes
+        Returns (probabilities, confidence)
+        """
+        # Pad or truncate to num_outcomes and renormalize in array form,
+        # keeping a single ndarray through the entropy reduction below
+        probs = _zeros(num_outcomes, dtype=np.float64)
+        n = min(len(proba), num_outcomes)
+        probs[:n] = proba[:n]
+        total = probs.sum()
+        if total > 0:
+            probs /= total
+        else:
+            probs.fill(1.0 / num_outcomes)
+
+        # Calculate confidence based on prediction entropy.
+        # xlogy handles p == 0 without branching, so the whole
+        # distribution is reduced in one vectorized call
+        entropy = -_xlogy(probs, probs).sum() / _ln2
+        max_entropy = _log2(num_outcomes)
+        confidence = 1.0 - (entropy / max_entropy) if max_entropy > 0 else 0.5
+        return probs.tolist(), confidence
+
+    def _scale_features(self, features):
+        """Scale features with the parameters learned at training time.
+        Uses the cached mean/inverse-scale arrays directly rather than
+        scaler.transform, whose fitted-state validation costs more than the
+        arithmetic; features pass through unchanged when no fitted scaler
+        was loaded."""
+        if self._scaler_mean is not None:
+            return (features - self._scaler_mean) * self._scaler_inv_scale
+        return features
+
+    def _build_response(self, market_data, probabilities, confidence):
+        """Build the JSON-serializable forecast response"""
+        num_outcomes = len(probabilities)
+        outcome_names = market_data.get('outcomes', [])
+        if not isinstance(outcome_names, list):
+            outcome_names = []
+
+        # Resolve outcome names and cast confidence once, outside the loop
+        names = [o.get('name', f'Outcome {i}') if isinstance(o, dict) else f'Outcome {i}'
+                 for i, o in enumerate(outcome_names[:num_outcomes])]
+        names += [f'Outcome {i}' for i in range(len(names), num_outcomes)]
+        conf = float(confidence)
+
+        # Every caller hands probabilities over as native floats (tolist() or
+        # literal uniform lists), so no per-element cast is needed here
+        forecast = [{
+            'outcome': names[i],
+            'outcomeId': i,
+            'probability': prob,
+            'confidence': conf
+        } for i, prob in enumerate(probabilities)]
+
+        return {
+            'forecast': forecast,
+            'confidence': conf,
+            'modelVersion': '1.0.0',
+            'timestamp': _fast_iso()
+        }
+
+    def _cache_key(self, market_data):
+        """
+        Stable key for a market snapshot, or None when the payload contains
+        unhashable values and cannot be memoized
+        """
+        try:
+            history = market_data.get('history', [])
+            last = history[-1] if history else None
+            outcomes = market_data.get('outcomes', [])
+            # The response embeds the outcome names, so the market identity
+            # must be part of the key or two markets with matching stats
+            # would be served each other's names
+            names = tuple(o.get('name') if isinstance(o, dict) else None
+                          for o in outcomes) if isinstance(outcomes, list) else None
+            key = (
+                market_data.get('id'),
+                names,
+                market_data.get('totalVolume'),
+                market_data.get('totalLiquidity'),
+                market_data.get('resolutionTime'),
+                tuple(market_data.get('prices', [])),
+                market_data.get('outcomeCount'),
+                len(history),
+                last.get('timestamp') if isinstance(last, dict) else None,
+            )
+            hash(key)  # probe hashability up front
+            return key
+        except TypeError:
+            return None
+
     def predict(self, market_data):
+        """
+        Generate forecast for a market, memoized per snapshot
+        Returns probability distribution over outcomes
+        """
+        key = self._cache_key(market_data)
+        if key is not None:
+            cached = self._forecast_cache.get(key)
+            if cached is not None:
+                self._forecast_cache.move_to_end(key)
+                # Same snapshot, fresh timestamp; copy the forecast rows so
+                # callers can never mutate the cached entry through the result
+                return {**cached,
+                        'forecast': [dict(row) for row in cached['forecast']],
+                        'timestamp': _fast_iso()}
+
+        result = self._predict_impl(market_data)
+        if key is not None and 'error' not in result:
+            self._forecast_cache[key] = result
+            if len(self._forecast_cache) > FORECAST_CACHE_SIZE:
+                self._forecast_cache.popitem(last=False)
+        return result
+
+    def _predict_impl(self, market_data):
         """
         Generate forecast for a market
         Returns probability distribution over outcomes
         """
         try:
-            # Extract features
-            features = self.extract_features(market_data)
-            
-            # Scale features
-            features_scaled = self.scaler.fit_transform(features)
-            
-            # Get number of outcomes
-            num_outcomes = market_data.get('outcomeCount', 2)
-            prices = market_data.get('prices', [])
-            
-            if len(prices) > 0:
-                num_outcomes = len(prices)
-            
-            # If model is not trained, return uniform distribution
+            num_outcomes = self._get_num_outcomes(market_data)
+
+            # If model is not trained, fall back to price-implied probabilities
             if self.model is None or not hasattr(self.model, 'predict_proba'):
-                # Return probabilities based on current prices (LMSR prices are already probabilities)
-                if prices and len(prices) > 0:
-                    probabilities = [float(p) for p in prices]
-                    # Normalize to ensure they sum to 1
-                    total = sum(probabilities)
-                    if total > 0:
-                        probabilities = [p / total for p in probabilities]
-                    else:
-                        probabilities = [1.0 / num_outcomes] * num_outcomes
-                else:
-                    probabilities = [1.0 / num_outcomes] * num_outcomes
-                
+                probabilities = self._price_distribution(market_data, num_outcomes)
                 confidence = 0.5  # Low confidence for untrained model
             else:
                 # Use model to predict
                 try:
-                    proba = self.model.predict_proba(features_scaled)[0]
-                    
-                    # Map to outcomes
-                    if len(proba) >= num_outcomes:
-                        probabilities = proba[:num_outcomes].tolist()
-                    else:
-                        # Pad with uniform distribution
-                        probabilities = proba.tolist()
-                        while len(probabilities) < num_outcomes:
-                            probabilities.append(0.0)
-                        # Normalize
-                        total = sum(probabilities)
-                        if total > 0:
-                            probabilities = [p / total for p in probabilities]
-                    
-                    # Calculate confidence based on prediction entropy
-                    entropy = -sum(p * np.log2(p + 1e-10) for p in probabilities if p > 0)
-                    max_entropy = np.log2(num_outcomes)
-                    confidence = 1.0 - (entropy / max_entropy) if max_entropy > 0 else 0.5
+                    features_scaled = self._scale_features(self.extract_features(market_data))
+                    proba = self._predict_proba(features_scaled)[0]
+                    probabilities, confidence = self._proba_to_distribution(proba, num_outcomes)
                 except Exception as e:
                     print(f"Prediction error: {e}", file=sys.stderr)
                     # Fallback to uniform
                     probabilities = [1.0 / num_outcomes] * num_outcomes
                     confidence = 0.3
-            
-            # Build forecast response
-            forecast = []
-            outcome_names = market_data.get('outcomes', [])
-            
-            for i, prob in enumerate(probabilities):
-                outcome_name = outcome_names[i].get('name', f'Outcome {i}') if isinstance(outcome_names, list) and i < len(outcome_names) else f'Outcome {i}'
-                forecast.append({
-                    'outcome': outcome_name,
-                    'outcomeId': i,
-                    'probability': float(prob),
-                    'confidence': float(confidence)
-                })
-            
-            return {
-                'forecast': forecast,
-                'confidence': float(confidence),
-                'modelVersion': '1.0.0',
-                'timestamp': datetime.now().isoformat()
-            }
+
+            return self._build_response(market_data, probabilities, confidence)
         except Exception as e:
             print(f"Error generating forecast: {e}", file=sys.stderr)
             # Return default forecast
@@ -202,31 +522,80 @@ class MarketForecastModel:
                 ],
                 'confidence': 0.3,
                 'modelVersion': '1.0.0',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _fast_iso(),
                 'error': str(e)
             }
 
+    def predict_batch(self, markets):
+        """
+        Generate forecasts for a list of markets with a single predict_proba
+        Stacking features into an (N, F) matrix amortizes scaling, dispatch
+        and tree-traversal cost across the whole batch
+        """
+        if not markets:
+            return []
+
+        if self.model is None or not hasattr(self.model, 'predict_proba'):
+            return [self.predict(market) for market in markets]
+
+        try:
+            now = time.time()
+            features = np.vstack([self.extract_features(m, now) for m in markets])
+            proba = self._predict_proba_batch(self._scale_features(features))
+        except Exception as e:
+            print(f"Batch prediction error: {e}", file=sys.stderr)
+            return [self.predict(market) for market in markets]
+
+        # Entropy confidence for the whole batch in one vectorized reduction;
+        # only markets whose outcome count differs from the model's class
+        # count fall back to the per-row padding path
+        n_classes = proba.shape[1]
+        entropies = -xlogy(proba, proba).sum(axis=1) / math.log(2)
+        max_entropy = math.log2(n_classes) if n_classes > 1 else 0.0
+        if max_entropy > 0:
+            confidences = 1.0 - entropies / max_entropy
+        else:
+            confidences = np.full(len(markets), 0.5)
+
+        results = []
+        for market_data, row, conf in zip(markets, proba, confidences):
+            try:
+                num_outcomes = self._get_num_outcomes(market_data)
+                if num_outcomes == n_classes:
+                    results.append(self._build_response(market_data, row.tolist(), conf))
+                else:
+                    probabilities, confidence = self._proba_to_distribution(row, num_outcomes)
+                    results.append(self._build_response(market_data, probabilities, confidence))
+            except Exception:
+                results.append(self.predict(market_data))
+        return results
+
 def main():
     """Main entry point for the forecast service"""
-    try:
-        # Read market data from stdin
-        input_data = sys.stdin.read()
-        market_data = json.loads(input_data)
-        
-        # Create model and generate forecast
-        model = MarketForecastModel()
-        forecast = model.predict(market_data)
-        
-        # Output forecast as JSON
-        print(json.dumps(forecast))
-    except Exception as e:
-        error_response = {
-            'error': str(e),
-            'forecast': [],
-            'confidence': 0.0
-        }
-        print(json.dumps(error_response))
-        sys.exit(1)
+    # Load the model once and reuse it for every request. The service speaks
+    # newline-delimited JSON on stdin/stdout (one market in, one forecast out)
+    # so a long-lived caller only pays the model load cost a single time.
+    model = MarketForecastModel()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            market_data = _json_loads(line)
+            # A JSON array is treated as a batch of markets
+            if isinstance(market_data, list):
+                forecast = model.predict_batch(market_data)
+            else:
+                forecast = model.predict(market_data)
+            print(_dumps_response(forecast), flush=True)
+        except Exception as e:
+            error_response = {
+                'error': str(e),
+                'forecast': [],
+                'confidence': 0.0
+            }
+            print(_json_dumps(error_response), flush=True)
 
 if __name__ == '__main__':
     main()